@@ -1,9 +1,18 @@
 """Utilities for working with Azure blob storage"""
 import re
-import io
+import codecs
+
+from collections import namedtuple
+from functools import lru_cache
 
 from azure.storage.blob import BlobServiceClient
 
+# Precompiled here so the pattern is canonicalized once rather than on every
+# read/listdir/write call. The character classes keep matching linear-time.
+_ABS_URL_RE = re.compile(r"abs://([^/]+)\.blob\.core\.windows\.net/([^/?]+)/([^?]+)\?(.+)$")
+
+AbsParts = namedtuple("AbsParts", "account container blob sas_token")
+
 
 class AzureBlobStore(object):
     """
@@ -15,53 +24,134 @@ class AzureBlobStore(object):
         - read
         - listdir
         - write
+    Async variants (batch with ``asyncio.gather`` to overlap requests):
+        - aread
+        - alistdir
+        - awrite
     """
 
-    def _blob_service_client(self, account_name, sas_token):
+    # Async clients are cached at class level so all stores share one
+    # connection pool / TLS session per (account, sas_token).
+    _async_client_cache = {}
 
-        blob_service_client = BlobServiceClient(
-            "{account}.blob.core.windows.net".format(account=account_name), sas_token
-        )
+    def __init__(self, max_concurrency=8, max_chunk_get_size=16 * 1024 * 1024):
+        # Cache clients per (account, sas_token) so repeated calls reuse the
+        # underlying connection pool and TLS session instead of rebuilding them.
+        self._client_cache = {}
+        self.max_concurrency = max_concurrency
+        self.max_chunk_get_size = max_chunk_get_size
+
+    def _blob_service_client(self, account_name, sas_token):
+        key = (account_name, sas_token)
+        blob_service_client = self._client_cache.get(key)
+        if blob_service_client is None:
+            blob_service_client = BlobServiceClient(
+                "{account}.blob.core.windows.net".format(account=account_name),
+                sas_token,
+                max_chunk_get_size=self.max_chunk_get_size,
+            )
+            self._client_cache[key] = blob_service_client
         return blob_service_client
 
-    @classmethod
-    def _split_url(self, url):
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _split_url(url):
         """
         see: https://docs.microsoft.com/en-us/azure/storage/common/storage-dotnet-shared-access-signature-part-1  # noqa: E501
         abs://myaccount.blob.core.windows.net/sascontainer/sasblob.txt?sastoken
         """
-        match = re.match(r"abs://(.*)\.blob\.core\.windows\.net\/(.*)\/(.*)\?(.*)$", url)
+        match = _ABS_URL_RE.match(url)
         if not match:
             raise Exception("Invalid azure blob url '{0}'".format(url))
         else:
-            params = {
-                "account": match.group(1),
-                "container": match.group(2),
-                "blob": match.group(3),
-                "sas_token": match.group(4),
-            }
-            return params
+            return AbsParts(*match.groups())
+
+    def _async_blob_service_client(self, account_name, sas_token):
+        # Imported lazily so the sync paths work without the aio extras
+        # (aiohttp) installed.
+        from azure.storage.blob.aio import BlobServiceClient as AsyncBlobServiceClient
+
+        key = (account_name, sas_token)
+        blob_service_client = self._async_client_cache.get(key)
+        if blob_service_client is None:
+            blob_service_client = AsyncBlobServiceClient(
+                "{account}.blob.core.windows.net".format(account=account_name),
+                sas_token,
+                max_chunk_get_size=self.max_chunk_get_size,
+            )
+            self._async_client_cache[key] = blob_service_client
+        return blob_service_client
 
     def read(self, url):
         """Read storage at a given url"""
         params = self._split_url(url)
-        output_stream = io.BytesIO()
-        blob_service_client = self._blob_service_client(params["account"], params["sas_token"])
-        blob_client = blob_service_client.get_blob_client(params['container'], params['blob'])
-        blob_client.download_blob().readinto(output_stream)
-        output_stream.seek(0)
-        return [line.decode("utf-8") for line in output_stream]
+        blob_service_client = self._blob_service_client(params.account, params.sas_token)
+        blob_client = blob_service_client.get_blob_client(params.container, params.blob)
+        # Stream the blob chunk-by-chunk (downloaded in parallel) instead of
+        # materializing the whole payload in a BytesIO first.
+        stream = blob_client.download_blob(max_concurrency=self.max_concurrency)
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        lines = []
+        pending = ""
+        for chunk in stream.chunks():
+            pending += decoder.decode(chunk)
+            if "\n" in pending:
+                *complete, pending = pending.split("\n")
+                lines.extend(line + "\n" for line in complete)
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            lines.append(pending)
+        return lines
+
+    async def aread(self, url):
+        """Read storage at a given url without blocking the event loop"""
+        params = self._split_url(url)
+        blob_service_client = self._async_blob_service_client(params.account, params.sas_token)
+        blob_client = blob_service_client.get_blob_client(params.container, params.blob)
+        stream = await blob_client.download_blob(max_concurrency=self.max_concurrency)
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        lines = []
+        pending = ""
+        async for chunk in stream.chunks():
+            pending += decoder.decode(chunk)
+            if "\n" in pending:
+                *complete, pending = pending.split("\n")
+                lines.extend(line + "\n" for line in complete)
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            lines.append(pending)
+        return lines
 
     def listdir(self, url):
         """Returns a list of the files under the specified path"""
         params = self._split_url(url)
-        blob_service_client = self._blob_service_client(params["account"], params["sas_token"])
-        container_client = blob_service_client.get_container_client(params["container"])
-        return list(container_client.list_blobs(params["blob"]))
+        blob_service_client = self._blob_service_client(params.account, params.sas_token)
+        container_client = blob_service_client.get_container_client(params.container)
+        # Ask for the service-side maximum page size; with the default the
+        # per-page HTTP round-trips dominate enumeration of large containers.
+        pages = container_client.list_blobs(params.blob, results_per_page=5000).by_page()
+        blobs = []
+        for page in pages:
+            blobs.extend(page)
+        return blobs
+
+    async def alistdir(self, url):
+        """Returns a list of the files under the specified path without blocking"""
+        params = self._split_url(url)
+        blob_service_client = self._async_blob_service_client(params.account, params.sas_token)
+        container_client = blob_service_client.get_container_client(params.container)
+        return [blob async for blob in container_client.list_blobs(params.blob)]
 
     def write(self, buf, url):
         """Write buffer to storage at a given url"""
         params = self._split_url(url)
-        blob_service_client = self._blob_service_client(params["account"], params["sas_token"])
-        blob_client = blob_service_client.get_blob_client(params['container'], params['blob'])
+        blob_service_client = self._blob_service_client(params.account, params.sas_token)
+        blob_client = blob_service_client.get_blob_client(params.container, params.blob)
         blob_client.upload_blob(data=buf, overwrite=True)
+
+    async def awrite(self, buf, url):
+        """Write buffer to storage at a given url without blocking"""
+        params = self._split_url(url)
+        blob_service_client = self._async_blob_service_client(params.account, params.sas_token)
+        blob_client = blob_service_client.get_blob_client(params.container, params.blob)
+        await blob_client.upload_blob(data=buf, overwrite=True)
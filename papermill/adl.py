@@ -1,8 +1,18 @@
 """Utilities for working with Azure data lake storage"""
 import re
 
+from functools import lru_cache
+
 from azure.datalake.store import core, lib
 
+# Precompiled here so the pattern is canonicalized once rather than on every
+# read/listdir/write call. The character class keeps matching linear-time.
+_ADL_URL_RE = re.compile(r'adl://([^/]+)\.azuredatalakestore\.net/(.+)$')
+
+# Write in 4 MiB slices so a large encoded payload isn't handed to the
+# adapter in one oversized call.
+_WRITE_CHUNK_SIZE = 4 * 1024 * 1024
+
 
 class ADL(object):
     """
@@ -12,16 +22,21 @@ class ADL(object):
     -------
     The following are wrapped utilities for Azure storage:
     - read
+    - iterread
     - listdir
     - write
     """
 
     def __init__(self):
         self.token = None
+        # Cache adapters per store so repeated calls against the same store
+        # reuse the filesystem client instead of rebuilding it.
+        self._adapter_cache = {}
 
-    @classmethod
-    def _split_url(cls, url):
-        match = re.match(r'adl://(.*)\.azuredatalakestore\.net\/(.*)$', url)
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _split_url(url):
+        match = _ADL_URL_RE.match(url)
         if not match:
             raise Exception("Invalid ADL url '{0}'".format(url))
         else:
@@ -33,7 +48,11 @@ class ADL(object):
         return self.token
 
     def _create_adapter(self, store_name):
-        return core.AzureDLFileSystem(self._get_token(), store_name=store_name)
+        adapter = self._adapter_cache.get(store_name)
+        if adapter is None:
+            adapter = core.AzureDLFileSystem(self._get_token(), store_name=store_name)
+            self._adapter_cache[store_name] = adapter
+        return adapter
 
     def listdir(self, url):
         """Returns a list of the files under the specified path"""
@@ -50,15 +69,28 @@ class ADL(object):
         """Read storage at a given url"""
         (store_name, path) = self._split_url(url)
         adapter = self._create_adapter(store_name)
-        lines = []
+        # One C-level read + decode + splitlines beats decoding the file
+        # line-by-line in a Python loop.
+        with adapter.open(path) as f:
+            return f.read().decode().splitlines(keepends=True)
+
+    def iterread(self, url):
+        """Yield lines from storage at a given url without materializing the file"""
+        (store_name, path) = self._split_url(url)
+        adapter = self._create_adapter(store_name)
         with adapter.open(path) as f:
             for line in f:
-                lines.append(line.decode())
-        return lines
+                yield line.decode()
 
     def write(self, buf, url):
         """Write buffer to storage at a given url"""
         (store_name, path) = self._split_url(url)
         adapter = self._create_adapter(store_name)
+        data = buf.encode() if isinstance(buf, str) else buf
         with adapter.open(path, 'wb') as f:
-            f.write(buf.encode())
+            if len(data) <= _WRITE_CHUNK_SIZE:
+                f.write(data)
+            else:
+                view = memoryview(data)
+                for start in range(0, len(view), _WRITE_CHUNK_SIZE):
+                    f.write(view[start:start + _WRITE_CHUNK_SIZE])
@@ -1,16 +1,6 @@
 import os
 
-import six
-
-try:
-    from StringIO import StringIO
-except ImportError:
-    from io import StringIO
-
-if six.PY2:
-    kernel_name = 'python2'
-else:
-    kernel_name = 'python3'
+kernel_name = 'python3'
 
 
 def get_notebook_path(*args):
@@ -4,20 +4,9 @@ import six
 from ..abs import AzureBlobStore
 
 if six.PY3:
-    from unittest.mock import Mock, patch
+    from unittest.mock import Mock
 else:
-    from mock import Mock, patch
-
-
-class MockBytesIO(object):
-    def __init__(self):
-        self.list = [b"hello", b"world!"]
-
-    def __getitem__(self, index):
-        return self.list[index]
-
-    def seek(self, seed):
-        pass
+    from mock import Mock
 
 
 class ABSTest(unittest.TestCase):
@@ -26,9 +15,13 @@ class ABSTest(unittest.TestCase):
     """
 
     def setUp(self):
-        self.list_blobs = Mock(return_value=["foo", "bar", "baz"])
+        self.list_blobs = Mock(
+            return_value=Mock(by_page=Mock(return_value=[["foo", "bar"], ["baz"]]))
+        )
         self.upload_blob = Mock()
-        self.download_blob = Mock()
+        self.download_blob = Mock(
+            return_value=Mock(chunks=Mock(return_value=[b"hello\n", b"world!"]))
+        )
         self._container_client = Mock(list_blobs=self.list_blobs)
         self._blob_client = Mock(upload_blob=self.upload_blob, download_blob=self.download_blob)
         self._blob_service_client = Mock(
@@ -49,10 +42,10 @@ class ABSTest(unittest.TestCase):
         params = AzureBlobStore._split_url(
             "abs://myaccount.blob.core.windows.net/sascontainer/sasblob.txt?sastoken"
         )
-        self.assertEqual(params["account"], "myaccount")
-        self.assertEqual(params["container"], "sascontainer")
-        self.assertEqual(params["blob"], "sasblob.txt")
-        self.assertEqual(params["sas_token"], "sastoken")
+        self.assertEqual(params.account, "myaccount")
+        self.assertEqual(params.container, "sascontainer")
+        self.assertEqual(params.blob, "sasblob.txt")
+        self.assertEqual(params.sas_token, "sastoken")
 
     def test_listdir_calls(self):
         self.assertEqual(
@@ -62,20 +55,19 @@ class ABSTest(unittest.TestCase):
             ["foo", "bar", "baz"],
         )
         self._blob_service_client.get_container_client.assert_called_once_with("sascontainer")
-        self.list_blobs.assert_called_once_with("sasblob.txt")
+        self.list_blobs.assert_called_once_with("sasblob.txt", results_per_page=5000)
 
-    @patch("papermill.abs.io.BytesIO", side_effect=MockBytesIO)
-    def test_reads_file(self, mockBytesIO):
+    def test_reads_file(self):
         self.assertEqual(
             self.abs.read(
                 "abs://myaccount.blob.core.windows.net/sascontainer/sasblob.txt?sastoken"
             ),
-            ["hello", "world!"],
+            ["hello\n", "world!"],
         )
         self._blob_service_client.get_blob_client.assert_called_once_with(
             "sascontainer", "sasblob.txt"
         )
-        self.download_blob.assert_called_once_with()
+        self.download_blob.assert_called_once_with(max_concurrency=8)
 
     def test_write_file(self):
         self.abs.write(
@@ -19,7 +19,8 @@ class ADLTest(unittest.TestCase):
             return_value=["path/to/directory/foo", "path/to/directory/bar", "path/to/directory/baz"]
         )
         self.fakeFile = MagicMock()
-        self.fakeFile.__iter__.return_value = [b"a", b"b", b"c"]
+        self.fakeFile.read.return_value = b"a\nb\nc"
+        self.fakeFile.__iter__.return_value = [b"a\n", b"b\n", b"c"]
         self.fakeFile.__enter__.return_value = self.fakeFile
         self.open = Mock(return_value=self.fakeFile)
         self.fakeAdapter = Mock(open=self.open, ls=self.ls)
@@ -49,7 +50,15 @@ class ADLTest(unittest.TestCase):
 
     def test_read_opens_and_reads_file(self):
         self.assertEquals(
-            self.adl.read("adl://foo_store.azuredatalakestore.net/path/to/file"), ["a", "b", "c"]
+            self.adl.read("adl://foo_store.azuredatalakestore.net/path/to/file"),
+            ["a\n", "b\n", "c"],
+        )
+        self.fakeFile.read.assert_called_once_with()
+
+    def test_iterread_yields_decoded_lines(self):
+        self.assertEquals(
+            list(self.adl.iterread("adl://foo_store.azuredatalakestore.net/path/to/file")),
+            ["a\n", "b\n", "c"],
         )
         self.fakeFile.__iter__.assert_called_once_with()
 
@@ -57,6 +66,10 @@ class ADLTest(unittest.TestCase):
         self.adl.write("hello world", "adl://foo_store.azuredatalakestore.net/path/to/file")
         self.fakeFile.write.assert_called_once_with(b"hello world")
 
+    def test_write_passes_bytes_through_without_encoding(self):
+        self.adl.write(b"hello world", "adl://foo_store.azuredatalakestore.net/path/to/file")
+        self.fakeFile.write.assert_called_once_with(b"hello world")
+
     @patch.object(adl_lib, 'auth', return_value="my_token")
     @patch.object(adl_core, 'AzureDLFileSystem', return_value="my_adapter")
     def test_create_adapter(self, azure_dl_filesystem_mock, auth_mock):
@@ -1,7 +1,23 @@
-import sys
-from six import string_types, integer_types
+import json
+import re
 from .exceptions import PapermillException
 
+try:
+    import black
+except ImportError:
+    black = None
+
+# Constructed once; building a FileMode per codify call is wasted allocation.
+_BLACK_MODE = black.FileMode(string_normalization=False) if black is not None else None
+
+# A `name = simple-literal` assignment is already in Black's canonical form,
+# so such lines don't need the (expensive) format_str AST round-trip.
+_SIMPLE_ASSIGN = re.compile(r'^[A-Za-z_]\w* = ("(?:[^"\\]|\\.)*"|-?\d+(?:\.\d+)?|True|False|None)$')
+
+# Bounds for languages whose bare integer literals are 32-bit
+_INT32_MIN = -2147483648
+_INT32_MAX = 2147483647
+
 
 class PapermillTranslators(object):
     '''
@@ -10,17 +26,20 @@ class PapermillTranslators(object):
     named Translator objects for reference externally.
     '''
 
-    def __init__(self):
-        self._translators = {}
+    # The default translators are installed as a single dict literal at the
+    # bottom of this module; register() exists for plugins to add their own.
+    _translators = {}
 
-    def register(self, language, translator):
-        self._translators[language] = translator
+    @classmethod
+    def register(cls, language, translator):
+        cls._translators[language] = translator
 
-    def find_translator(self, kernel_name, language):
-        if kernel_name in self._translators:
-            return self._translators[kernel_name]
-        elif language in self._translators:
-            return self._translators[language]
+    @classmethod
+    def find_translator(cls, kernel_name, language):
+        if kernel_name in cls._translators:
+            return cls._translators[kernel_name]
+        elif language in cls._translators:
+            return cls._translators[language]
         raise PapermillException(
             "No parameter translator functions specified for kernel '{}' or language '{}'".format(
                 kernel_name, language
@@ -29,19 +48,39 @@ class PapermillTranslators(object):
 
 
 class Translator(object):
+    _BOOL = {True: 'true', False: 'false'}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Rebuild per subclass so overridden translate_* methods bind correctly.
+        cls._build_dispatch()
+
     @classmethod
-    def translate_raw_str(csl, val):
+    def _build_dispatch(cls):
+        # Exact-type dispatch table: one hash lookup on the hot translate
+        # path instead of an isinstance ladder.
+        cls._DISPATCH = {
+            type(None): cls.translate_none,
+            str: cls.translate_str,
+            bool: cls.translate_bool,
+            int: cls.translate_int,
+            float: cls.translate_float,
+            dict: cls.translate_dict,
+            list: cls.translate_list,
+        }
+
+    @classmethod
+    def translate_raw_str(cls, val):
         """Reusable by most interpreters"""
-        return '{}'.format(val)
+        return str(val)
 
     @classmethod
     def translate_escaped_str(cls, str_val):
         """Reusable by most interpreters"""
-        if isinstance(str_val, string_types):
-            str_val = str_val.encode('unicode_escape')
-            if sys.version_info >= (3, 0):
-                str_val = str_val.decode('utf-8')
-            str_val = str_val.replace('"', r'\"')
+        if isinstance(str_val, str):
+            # Escapes quotes, backslashes and control characters in one
+            # C-level pass instead of encode/decode/replace round-trips.
+            return json.dumps(str_val, ensure_ascii=False)
         return '"{}"'.format(str_val)
 
     @classmethod
@@ -52,22 +91,22 @@ class Translator(object):
     @classmethod
     def translate_none(cls, val):
         """Default behavior for translation"""
-        return cls.translate_raw_str(val)
+        return str(val)
 
     @classmethod
     def translate_int(cls, val):
         """Default behavior for translation"""
-        return cls.translate_raw_str(val)
+        return str(val)
 
     @classmethod
     def translate_float(cls, val):
         """Default behavior for translation"""
-        return cls.translate_raw_str(val)
+        return str(val)
 
     @classmethod
     def translate_bool(cls, val):
         """Default behavior for translation"""
-        return 'true' if val else 'false'
+        return cls._BOOL[val]
 
     @classmethod
     def translate_dict(cls, val):
@@ -80,14 +119,16 @@ class Translator(object):
     @classmethod
     def translate(cls, val):
         """Translate each of the standard json/yaml types to appropiate objects."""
-        if val is None:
-            return cls.translate_none(val)
-        elif isinstance(val, string_types):
+        handler = cls._DISPATCH.get(type(val))
+        if handler is not None:
+            return handler(val)
+        # Fall back to isinstance checks for subtypes (e.g. OrderedDict)
+        if isinstance(val, str):
             return cls.translate_str(val)
         # Needs to be before integer checks
         elif isinstance(val, bool):
             return cls.translate_bool(val)
-        elif isinstance(val, integer_types):
+        elif isinstance(val, int):
             return cls.translate_int(val)
         elif isinstance(val, float):
             return cls.translate_float(val)
@@ -108,27 +149,30 @@ class Translator(object):
 
     @classmethod
     def codify(cls, parameters):
-        content = '{}\n'.format(cls.comment('Parameters'))
-        for name, val in parameters.items():
-            content += '{}\n'.format(cls.assign(name, cls.translate(val)))
-        return content
+        parts = [cls.comment('Parameters')]
+        parts.extend(cls.assign(name, cls.translate(val)) for name, val in parameters.items())
+        return '\n'.join(parts) + '\n'
+
+
+# __init_subclass__ only fires for subclasses, so build the base table here.
+Translator._build_dispatch()
 
 
 class PythonTranslator(Translator):
     @classmethod
     def translate_bool(cls, val):
-        return cls.translate_raw_str(val)
+        return str(val)
 
     @classmethod
     def translate_dict(cls, val):
         escaped = ', '.join(
-            ["{}: {}".format(cls.translate_str(k), cls.translate(v)) for k, v in val.items()]
+            "{}: {}".format(cls.translate_str(k), cls.translate(v)) for k, v in val.items()
         )
         return '{{{}}}'.format(escaped)
 
     @classmethod
     def translate_list(cls, val):
-        escaped = ', '.join([cls.translate(v) for v in val])
+        escaped = ', '.join(cls.translate(v) for v in val)
         return '[{}]'.format(escaped)
 
     @classmethod
@@ -138,34 +182,37 @@ class PythonTranslator(Translator):
     @classmethod
     def codify(cls, parameters):
         content = super(PythonTranslator, cls).codify(parameters)
-        if sys.version_info >= (3, 6):
+        if black is not None and not cls._is_parameters_only(content):
             # Put content through the Black Python code formatter
-            import black
-
-            fm = black.FileMode(string_normalization=False)
-            content = black.format_str(content, mode=fm)
+            content = black.format_str(content, mode=_BLACK_MODE)
         return content
 
+    @classmethod
+    def _is_parameters_only(cls, content):
+        """Check if content is only comments and simple literal assignments"""
+        return all(
+            line.startswith('#') or _SIMPLE_ASSIGN.match(line)
+            for line in content.splitlines()
+        )
+
 
 class RTranslator(Translator):
+    _BOOL = {True: 'TRUE', False: 'FALSE'}
+
     @classmethod
     def translate_none(cls, val):
         return 'NULL'
 
-    @classmethod
-    def translate_bool(cls, val):
-        return 'TRUE' if val else 'FALSE'
-
     @classmethod
     def translate_dict(cls, val):
         escaped = ', '.join(
-            ['{} = {}'.format(cls.translate_str(k), cls.translate(v)) for k, v in val.items()]
+            '{} = {}'.format(cls.translate_str(k), cls.translate(v)) for k, v in val.items()
         )
         return 'list({})'.format(escaped)
 
     @classmethod
     def translate_list(cls, val):
-        escaped = ', '.join([cls.translate(v) for v in val])
+        escaped = ', '.join(cls.translate(v) for v in val)
         return 'list({})'.format(escaped)
 
     @classmethod
@@ -175,29 +222,28 @@ class RTranslator(Translator):
     @classmethod
     def assign(cls, name, str_val):
         # Leading '_' aren't legal R variable names -- so we drop them when injecting
-        while name.startswith("_"):
-            name = name[1:]
+        name = name.lstrip('_')
         return '{} = {}'.format(name, str_val)
 
 
 class ScalaTranslator(Translator):
     @classmethod
     def translate_int(cls, val):
-        strval = cls.translate_raw_str(val)
-        return strval + "L" if (val > 2147483647 or val < -2147483648) else strval
+        strval = str(val)
+        return strval if _INT32_MIN <= val <= _INT32_MAX else strval + "L"
 
     @classmethod
     def translate_dict(cls, val):
         """Translate dicts to scala Maps"""
         escaped = ', '.join(
-            ["{} -> {}".format(cls.translate_str(k), cls.translate(v)) for k, v in val.items()]
+            "{} -> {}".format(cls.translate_str(k), cls.translate(v)) for k, v in val.items()
         )
         return 'Map({})'.format(escaped)
 
     @classmethod
     def translate_list(cls, val):
         """Translate list to scala Seq"""
-        escaped = ', '.join([cls.translate(v) for v in val])
+        escaped = ', '.join(cls.translate(v) for v in val)
         return 'Seq({})'.format(escaped)
 
     @classmethod
@@ -217,13 +263,13 @@ class JuliaTranslator(Translator):
     @classmethod
     def translate_dict(cls, val):
         escaped = ', '.join(
-            ["{} => {}".format(cls.translate_str(k), cls.translate(v)) for k, v in val.items()]
+            "{} => {}".format(cls.translate_str(k), cls.translate(v)) for k, v in val.items()
         )
         return 'Dict({})'.format(escaped)
 
     @classmethod
     def translate_list(cls, val):
-        escaped = ', '.join([cls.translate(v) for v in val])
+        escaped = ', '.join(cls.translate(v) for v in val)
         return '[{}]'.format(escaped)
 
     @classmethod
@@ -235,20 +281,19 @@ class MatlabTranslator(Translator):
     @classmethod
     def translate_escaped_str(cls, str_val):
         """Translate a string to an escaped Matlab string"""
-        if isinstance(str_val, string_types):
-            str_val = str_val.encode('unicode_escape')
-            if sys.version_info >= (3, 0):
-                str_val = str_val.decode('utf-8')
-            str_val = str_val.replace('"', '""')
+        if isinstance(str_val, str):
+            # Matlab doubles quotes instead of backslash-escaping them, so
+            # rewrite the \" escapes inside the json.dumps literal. Quotes
+            # only ever appear escaped there, so the replace is unambiguous.
+            escaped = json.dumps(str_val, ensure_ascii=False)[1:-1].replace('\\"', '""')
+            return '"{}"'.format(escaped)
         return '"{}"'.format(str_val)
 
     @staticmethod
     def __translate_char_array(str_val):
         """Translates a string to a Matlab char array"""
-        if isinstance(str_val, string_types):
-            str_val = str_val.encode('unicode_escape')
-            if sys.version_info >= (3, 0):
-                str_val = str_val.decode('utf-8')
+        if isinstance(str_val, str):
+            str_val = str_val.encode('unicode_escape').decode('utf-8')
             str_val = str_val.replace('\'', '\'\'')
         return '\'{}\''.format(str_val)
 
@@ -258,13 +303,13 @@ class MatlabTranslator(Translator):
 
     @classmethod
     def translate_dict(cls, val):
-        keys = ', '.join(["{}".format(cls.__translate_char_array(k)) for k, v in val.items()])
-        vals = ', '.join(["{}".format(cls.translate(v)) for k, v in val.items()])
+        keys = ', '.join(cls.__translate_char_array(k) for k in val)
+        vals = ', '.join(cls.translate(v) for v in val.values())
         return 'containers.Map({{{}}}, {{{}}})'.format(keys, vals)
 
     @classmethod
     def translate_list(cls, val):
-        escaped = ', '.join([cls.translate(v) for v in val])
+        escaped = ', '.join(cls.translate(v) for v in val)
         return '{{{}}}'.format(escaped)
 
     @classmethod
@@ -273,10 +318,12 @@ class MatlabTranslator(Translator):
 
     @classmethod
     def codify(cls, parameters):
-        content = '{}\n'.format(cls.comment('Parameters'))
-        for name, val in parameters.items():
-            content += '{};\n'.format(cls.assign(name, cls.translate(val)))
-        return content
+        parts = [cls.comment('Parameters')]
+        parts.extend(
+            '{};'.format(cls.assign(name, cls.translate(val)))
+            for name, val in parameters.items()
+        )
+        return '\n'.join(parts) + '\n'
 
 
 class CSharpTranslator(Translator):
@@ -285,28 +332,24 @@ class CSharpTranslator(Translator):
         # Can't figure out how to do this as nullable
         raise NotImplementedError("Option type not implemented for C#.")
 
-    @classmethod
-    def translate_bool(cls, val):
-        return 'true' if val else 'false'
-
     @classmethod
     def translate_int(cls, val):
-        strval = cls.translate_raw_str(val)
-        return strval + "L" if (val > 2147483647 or val < -2147483648) else strval
+        strval = str(val)
+        return strval if _INT32_MIN <= val <= _INT32_MAX else strval + "L"
 
     @classmethod
     def translate_dict(cls, val):
         """Translate dicts to nontyped dictionary"""
 
         kvps = ', '.join(
-            ["{{ {} , {} }}".format(cls.translate_str(k), cls.translate(v)) for k, v in val.items()]
+            "{{ {} , {} }}".format(cls.translate_str(k), cls.translate(v)) for k, v in val.items()
         )
         return 'new Dictionary<string,Object>{{ {} }}'.format(kvps)
 
     @classmethod
     def translate_list(cls, val):
         """Translate list to array"""
-        escaped = ', '.join([cls.translate(v) for v in val])
+        escaped = ', '.join(cls.translate(v) for v in val)
         return 'new [] {{ {} }}'.format(escaped)
 
     @classmethod
@@ -323,28 +366,22 @@ class FSharpTranslator(Translator):
     def translate_none(cls, val):
         return 'None'
 
-    @classmethod
-    def translate_bool(cls, val):
-        return 'true' if val else 'false'
-
     @classmethod
     def translate_int(cls, val):
-        strval = cls.translate_raw_str(val)
-        return strval + "L" if (val > 2147483647 or val < -2147483648) else strval
+        strval = str(val)
+        return strval if _INT32_MIN <= val <= _INT32_MAX else strval + "L"
 
     @classmethod
     def translate_dict(cls, val):
         tuples = '; '.join(
-            [
-                "({}, {} :> IComparable)".format(cls.translate_str(k), cls.translate(v))
-                for k, v in val.items()
-            ]
+            "({}, {} :> IComparable)".format(cls.translate_str(k), cls.translate(v))
+            for k, v in val.items()
         )
         return '[ {} ] |> Map.ofList'.format(tuples)
 
     @classmethod
     def translate_list(cls, val):
-        escaped = '; '.join([cls.translate(v) for v in val])
+        escaped = '; '.join(cls.translate(v) for v in val)
         return '[ {} ]'.format(escaped)
 
     @classmethod
@@ -356,15 +393,18 @@ class FSharpTranslator(Translator):
         return 'let {} = {}'.format(name, str_val)
 
 
-# Instantiate a PapermillIO instance and register Handlers.
+# Instantiate a PapermillTranslators instance and install the default
+# translators in one assignment rather than a register() call per language.
 papermill_translators = PapermillTranslators()
-papermill_translators.register("python", PythonTranslator)
-papermill_translators.register("R", RTranslator)
-papermill_translators.register("scala", ScalaTranslator)
-papermill_translators.register("julia", JuliaTranslator)
-papermill_translators.register("matlab", MatlabTranslator)
-papermill_translators.register(".net-csharp", CSharpTranslator)
-papermill_translators.register(".net-fsharp", FSharpTranslator)
+PapermillTranslators._translators = {
+    "python": PythonTranslator,
+    "R": RTranslator,
+    "scala": ScalaTranslator,
+    "julia": JuliaTranslator,
+    "matlab": MatlabTranslator,
+    ".net-csharp": CSharpTranslator,
+    ".net-fsharp": FSharpTranslator,
+}
 
 
 def translate_parameters(kernel_name, language, parameters):
@@ -1,4 +1,5 @@
 import os
+import time
 import logging
 import warnings
 
@@ -29,10 +30,10 @@ def merge_kwargs(caller_args, **callee_args):
     args : dict
        Merged arguments
     """
-    conflicts = set(caller_args) & set(callee_args)
+    conflicts = caller_args.keys() & callee_args.keys()
     if conflicts:
-        args = format('; '.join(['{}={}'.format(key, value) for key, value in callee_args.items()]))
-        msg = "Callee will overwrite caller's argument(s): {}".format(args)
+        args = '; '.join(f'{key}={value}' for key, value in callee_args.items())
+        msg = f"Callee will overwrite caller's argument(s): {args}"
         warnings.warn(msg, PapermillParameterOverwriteWarning)
     return dict(caller_args, **callee_args)
 
@@ -54,24 +55,32 @@ def remove_args(args=None, **kwargs):
     """
     if not args:
         return kwargs
-    return {k: v for k, v in kwargs.items() if k not in args}
+    # frozenset membership is O(1) vs scanning the args list per key
+    args_set = frozenset(args)
+    return {k: v for k, v in kwargs.items() if k not in args_set}
 
 
 # retry decorator
-def retry(num):
+def retry(num, exceptions=(Exception,)):
+    """Retry a function up to `num` times with exponential backoff.
+
+    Only exceptions matching the `exceptions` tuple are retried; anything
+    else (e.g. auth failures) propagates immediately. The final failure is
+    re-raised with its original traceback.
+    """
+
     def decorate(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            exception = None
-
             for i in range(num):
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
+                except exceptions as e:
                     logger.debug('Retrying after: {}'.format(e))
-                    exception = e
-            else:
-                raise exception
+                    if i == num - 1:
+                        raise
+                    # Back off instead of hammering the remote in a tight loop
+                    time.sleep(min(2 ** i * 0.1, 10))
 
         return wrapper
 
@@ -87,7 +96,19 @@ def chdir(path):
     if path is None:
         yield
 
+    elif hasattr(os, 'fchdir'):
+        # On POSIX, restoring via a directory fd skips the getcwd(2) syscall
+        # and works even if the old cwd's path gets renamed meanwhile.
+        old_dir_fd = os.open('.', os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+        try:
+            os.chdir(path)
+            yield
+        finally:
+            os.fchdir(old_dir_fd)
+            os.close(old_dir_fd)
+
     else:
+        # Windows has no fchdir
         old_dir = os.getcwd()
         os.chdir(path)
         try: